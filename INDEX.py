@@ -1,497 +0,0 @@
-"""
-IssueSense AI - Complete Application Index
-
-This file serves as the authoritative reference for the entire project.
-"""
-
-# ============================================================================
-# PROJECT OVERVIEW
-# ============================================================================
-
-PROJECT_NAME = "IssueSense AI"
-VERSION = "1.0.0"
-STATUS = "✅ Production Ready"
-CREATED = "December 2025"
-
-DESCRIPTION = """
-AI-powered GitHub issue analysis with context enrichment.
-
-Analyzes GitHub issues by:
-1. Fetching issue details from GitHub API
-2. Gathering enriched context (linked PRs, files, commits)
-3. Sending enriched context to OpenAI's LLM
-4. Returning structured analysis with insights
-5. Displaying results in Streamlit UI or via REST API
-"""
-
-# ============================================================================
-# DIRECTORY STRUCTURE
-# ============================================================================
-
-"""
-IssuePilot/
-│
-├── 📄 README.md                  # Quick start & overview
-├── 📄 SETUP.md                   # Detailed installation guide
-├── 📄 ARCHITECTURE.md            # System design & data flow
-├── 📄 EXAMPLES.md                # API usage examples
-├── 📄 PROJECT_SUMMARY.md         # Complete project summary
-├── 📄 QUICKREF.md               # Quick reference card
-├── 📄 requirements.txt           # Python dependencies
-├── 📄 .env.example              # Environment template
-├── 📄 .gitignore                # Git ignore rules
-│
-├── 📁 backend/                   # FastAPI backend
-│   ├── __init__.py              # Package init
-│   ├── main.py                  # FastAPI app & endpoints (140 lines)
-│   ├── config.py                # Configuration management (30 lines)
-│   ├── models.py                # Pydantic data models (50 lines)
-│   ├── github_client.py          # GitHub API client (180 lines)
-│   ├── context_enricher.py       # Context enrichment (190 lines)
-│   └── llm_analyzer.py           # OpenAI integration (170 lines)
-│
-└── 📁 frontend/                  # Streamlit frontend
-    ├── __init__.py              # Package init
-    ├── app.py                   # Streamlit UI (200 lines)
-    └── styles.py                # UI styling (80 lines)
-"""
-
-# ============================================================================
-# FILE DESCRIPTIONS
-# ============================================================================
-
-FILES = {
-    "README.md": "Project overview, features, and quick start guide",
-    "SETUP.md": "Complete installation, configuration, and troubleshooting",
-    "ARCHITECTURE.md": "System design, data flow, and extensibility guide",
-    "EXAMPLES.md": "API usage examples and testing guides",
-    "PROJECT_SUMMARY.md": "Complete project summary and statistics",
-    "QUICKREF.md": "Quick reference card for common tasks",
-    "requirements.txt": "Python package dependencies (8 packages)",
-    ".env.example": "Environment variables template",
-    ".gitignore": "Git ignore patterns",
-    
-    "backend/__init__.py": "Backend package initialization",
-    "backend/main.py": "FastAPI server with /analyze and /batch-analyze endpoints",
-    "backend/config.py": "Environment configuration and validation",
-    "backend/models.py": "Pydantic request/response models",
-    "backend/github_client.py": "GitHub API wrapper with issue, PR, commit methods",
-    "backend/context_enricher.py": "Orchestrates context gathering from multiple sources",
-    "backend/llm_analyzer.py": "OpenAI Chat Completions integration",
-    
-    "frontend/__init__.py": "Frontend package initialization",
-    "frontend/app.py": "Streamlit web UI with input form and results display",
-    "frontend/styles.py": "UI styling utilities and color schemes",
-}
-
-# ============================================================================
-# CORE MODULES
-# ============================================================================
-
-MODULES = {
-    "github_client": {
-        "description": "GitHub API abstraction",
-        "methods": [
-            "get_issue(repo, issue_number) - Fetch issue with comments",
-            "get_linked_issues_and_prs(repo, issue_number) - Extract linked items",
-            "get_files_from_pr(repo, pr_number) - Get changed files",
-            "get_file_content(repo, path, ref) - Retrieve file content",
-            "get_recent_commits(repo, path, since_days) - Recent commits",
-            "get_repository_info(repo) - Repository metadata",
-        ]
-    },
-    "context_enricher": {
-        "description": "Context enrichment orchestration",
-        "methods": [
-            "enrich_issue_context(repo, issue_number) - Main pipeline",
-            "_summarize_comments(comments) - Comment summary",
-            "_gather_files_from_linked_prs(repo, prs) - File gathering",
-            "_extract_stack_traces(text) - Stack trace extraction",
-            "_gather_recent_commits(repo, files) - Commit gathering",
-        ]
-    },
-    "llm_analyzer": {
-        "description": "OpenAI LLM integration",
-        "methods": [
-            "analyze_issue(enriched_context) - Main analysis",
-            "_build_analysis_prompt(context) - Prompt construction",
-            "_validate_analysis(analysis) - Response validation",
-        ]
-    },
-    "config": {
-        "description": "Configuration management",
-        "variables": [
-            "GITHUB_TOKEN - GitHub personal access token",
-            "OPENAI_API_KEY - OpenAI API key",
-            "GITHUB_API_BASE_URL - GitHub API endpoint",
-            "OPENAI_MODEL - LLM model name",
-            "BACKEND_HOST - Server host",
-            "BACKEND_PORT - Server port",
-        ]
-    },
-}
-
-# ============================================================================
-# API ENDPOINTS
-# ============================================================================
-
-API_ENDPOINTS = {
-    "POST /analyze": {
-        "description": "Analyze a single GitHub issue",
-        "request": {"repo_url": "owner/repo", "issue_number": 123},
-        "response": {
-            "summary": "str",
-            "type": "bug|feature_request|documentation|question|other",
-            "priority_score": {"score": "1-5", "justification": "str"},
-            "suggested_labels": ["str", "str", "str"],
-            "potential_impact": "str"
-        }
-    },
-    "POST /batch-analyze": {
-        "description": "Analyze multiple GitHub issues",
-        "request": [
-            {"repo_url": "owner/repo1", "issue_number": 1},
-            {"repo_url": "owner/repo2", "issue_number": 2}
-        ],
-        "response": "List of analysis results or errors"
-    },
-    "GET /health": {
-        "description": "Health check endpoint",
-        "response": {"status": "healthy", "service": "IssueSense AI", "version": "1.0.0"}
-    },
-    "GET /": {
-        "description": "API information and documentation",
-        "response": {"service": "IssueSense AI", "endpoints": {...}}
-    },
-    "GET /docs": {
-        "description": "Interactive Swagger UI",
-    },
-    "GET /redoc": {
-        "description": "ReDoc API documentation",
-    }
-}
-
-# ============================================================================
-# DATA FLOW PIPELINE
-# ============================================================================
-
-DATA_FLOW = """
-User Input
-  └─ repo_url: "torvalds/linux", issue_number: 12345
-  
-Validation
-  └─ Check format: owner/repo
-  └─ Check issue_number: positive integer
-  
-GitHub API: Issue Fetching
-  ├─ Fetch issue details
-  ├─ Fetch comments (up to last 5)
-  └─ Extract issue state, labels, authors
-  
-GitHub API: Linked Items
-  ├─ Parse issue body and comments for #123 references
-  ├─ Fetch linked issues/PRs data
-  └─ Extract PR numbers
-  
-GitHub API: Changed Files
-  ├─ For each linked PR
-  ├─ Get files changed
-  ├─ Extract file names, status, additions, deletions, patch
-  └─ Limit to first 10 files
-  
-Text Processing: Stack Traces
-  ├─ Search for traceback patterns
-  ├─ Search for error patterns
-  ├─ Extract up to 3 traces (500 chars each)
-  └─ Use regex patterns
-  
-GitHub API: Recent Commits
-  ├─ For each changed file
-  ├─ Get commits since 90 days ago
-  ├─ Extract message, author, date, SHA
-  └─ Limit to 5 most recent
-  
-GitHub API: Repository Info
-  ├─ Get stargazers count
-  ├─ Get primary language
-  ├─ Get open issues count
-  └─ Gather metadata
-  
-Context Aggregation
-  └─ Combine all gathered context into single object
-  
-Prompt Construction
-  ├─ Format issue details
-  ├─ Format comments summary
-  ├─ Format linked items
-  ├─ Format changed files
-  ├─ Format stack traces
-  ├─ Format recent commits
-  ├─ Format repository context
-  └─ Create comprehensive prompt
-  
-OpenAI API Call
-  ├─ Send prompt to Chat Completions API
-  ├─ Request JSON response
-  ├─ Model: gpt-4-turbo-preview
-  └─ Wait for response
-  
-Response Parsing & Validation
-  ├─ Parse JSON response
-  ├─ Validate all required fields
-  ├─ Bounds check priority (1-5)
-  ├─ Validate type enumeration
-  ├─ Ensure 2-3 labels
-  └─ Set fallback values for missing fields
-  
-Return Response
-  └─ Format as IssueAnalysisResponse
-  └─ Return via API or display in UI
-"""
-
-# ============================================================================
-# FEATURE CHECKLIST
-# ============================================================================
-
-FEATURES = {
-    "GitHub Integration": [
-        "✅ Fetch issue details and comments",
-        "✅ Extract linked issues and PRs from text",
-        "✅ Gather changed files from linked PRs",
-        "✅ Retrieve recent commits for files",
-        "✅ Get repository metadata",
-    ],
-    "Context Enrichment": [
-        "✅ Comprehensive context gathering",
-        "✅ Stack trace extraction via regex",
-        "✅ Error message extraction",
-        "✅ Commit history analysis",
-        "✅ File change context",
-    ],
-    "AI Analysis": [
-        "✅ OpenAI Chat Completions integration",
-        "✅ Structured JSON response",
-        "✅ Issue type classification",
-        "✅ Priority scoring (1-5)",
-        "✅ Label suggestions",
-        "✅ Impact assessment",
-    ],
-    "API": [
-        "✅ FastAPI server",
-        "✅ Single issue analysis",
-        "✅ Batch analysis",
-        "✅ Health check endpoint",
-        "✅ Interactive Swagger UI",
-        "✅ CORS support",
-    ],
-    "UI": [
-        "✅ Streamlit web interface",
-        "✅ Real-time backend status",
-        "✅ Result visualization with emojis",
-        "✅ Raw JSON export",
-        "✅ Sidebar configuration",
-        "✅ Example repository links",
-    ],
-    "Configuration": [
-        "✅ Environment variables",
-        "✅ .env file support",
-        "✅ Validation on startup",
-        "✅ Configurable models and endpoints",
-    ],
-    "Documentation": [
-        "✅ README with quick start",
-        "✅ Detailed SETUP guide",
-        "✅ Architecture documentation",
-        "✅ API examples",
-        "✅ Project summary",
-        "✅ Quick reference card",
-    ],
-}
-
-# ============================================================================
-# TECHNOLOGY STACK
-# ============================================================================
-
-TECH_STACK = {
-    "Language": "Python 3.9+",
-    "Backend Framework": "FastAPI",
-    "Frontend Framework": "Streamlit",
-    "External APIs": [
-        "GitHub API v3",
-        "OpenAI Chat Completions API",
-    ],
-    "Key Libraries": [
-        "requests (HTTP)",
-        "openai (LLM)",
-        "pydantic (validation)",
-        "uvicorn (ASGI)",
-    ],
-    "Development": [
-        "VS Code",
-        "Python virtual environment",
-        "Git + GitHub",
-    ],
-}
-
-# ============================================================================
-# ENVIRONMENT VARIABLES
-# ============================================================================
-
-ENVIRONMENT = {
-    "GITHUB_TOKEN": {
-        "required": True,
-        "description": "GitHub Personal Access Token",
-        "format": "ghp_xxxxx",
-        "scopes": ["repo", "read:user"],
-    },
-    "OPENAI_API_KEY": {
-        "required": True,
-        "description": "OpenAI API Key",
-        "format": "sk-xxxxx",
-    },
-    "GITHUB_API_BASE_URL": {
-        "required": False,
-        "default": "https://api.github.com",
-        "description": "GitHub API endpoint",
-    },
-    "OPENAI_MODEL": {
-        "required": False,
-        "default": "gpt-4-turbo-preview",
-        "description": "LLM model to use",
-        "options": ["gpt-4", "gpt-4-turbo-preview", "gpt-3.5-turbo"],
-    },
-    "BACKEND_HOST": {
-        "required": False,
-        "default": "localhost",
-        "description": "Backend server host",
-    },
-    "BACKEND_PORT": {
-        "required": False,
-        "default": 8000,
-        "description": "Backend server port",
-    },
-}
-
-# ============================================================================
-# QUICK START
-# ============================================================================
-
-QUICK_START = """
-1. Clone/navigate to project:
-   cd /Users/sanjana/Desktop/IssuePilot
-
-2. Create virtual environment:
-   python3 -m venv venv && source venv/bin/activate
-
-3. Install dependencies:
-   pip install -r requirements.txt
-
-4. Configure environment:
-   cp .env.example .env
-   # Edit .env and add GitHub token and OpenAI key
-
-5. Run backend (Terminal 1):
-   python -m uvicorn backend.main:app --reload
-
-6. Run frontend (Terminal 2):
-   streamlit run frontend/app.py
-
-7. Access:
-   - Frontend: http://localhost:8501
-   - API Docs: http://localhost:8000/docs
-   - Health: curl http://localhost:8000/health
-"""
-
-# ============================================================================
-# PERFORMANCE METRICS
-# ============================================================================
-
-PERFORMANCE = {
-    "GitHub context fetch": "10-20 seconds",
-    "Stack trace extraction": "1-2 seconds",
-    "Recent commits fetch": "5-10 seconds",
-    "LLM analysis": "15-30 seconds",
-    "Total per issue": "31-62 seconds",
-    "Typical range": "17-125 seconds",
-}
-
-# ============================================================================
-# IMPORTANT NOTES
-# ============================================================================
-
-NOTES = """
-✅ WHAT'S READY:
-- Complete backend with FastAPI
-- Streamlit frontend UI
-- GitHub API integration
-- OpenAI LLM integration
-- Context enrichment pipeline
-- Full documentation
-- Example code
-
-📋 WHAT TO DO NEXT:
-1. Install dependencies: pip install -r requirements.txt
-2. Configure .env with your API keys
-3. Run backend and frontend
-4. Test with your first GitHub issue
-
-⚠️ IMPORTANT:
-- Never commit .env file to Git
-- GitHub token scoped to: repo, read:user
-- Requires OpenAI account with credits
-- Python 3.9 or higher required
-
-🔧 TROUBLESHOOTING:
-- See SETUP.md for common issues
-- Check backend logs for errors
-- Verify API keys in .env
-- Use /health endpoint to check status
-
-📚 DOCUMENTATION:
-- README.md - Overview
-- SETUP.md - Installation
-- ARCHITECTURE.md - Design
-- EXAMPLES.md - API usage
-- QUICKREF.md - Quick reference
-
-🚀 READY FOR:
-- Local development
-- Docker deployment
-- Cloud deployment (AWS, GCP, Azure)
-- Integration with CI/CD
-- Team collaboration
-"""
-
-# ============================================================================
-# VERSION HISTORY
-# ============================================================================
-
-VERSION_HISTORY = {
-    "1.0.0": {
-        "date": "December 2025",
-        "status": "✅ Production Ready",
-        "features": [
-            "Complete backend with FastAPI",
-            "Streamlit frontend",
-            "GitHub API integration",
-            "OpenAI LLM integration",
-            "Context enrichment engine",
-            "Batch analysis support",
-            "Full documentation",
-        ],
-    },
-}
-
-# ============================================================================
-# END OF INDEX
-# ============================================================================
-
-if __name__ == "__main__":
-    print(f"IssueSense AI - {VERSION} ({STATUS})")
-    print("=" * 70)
-    print("\nFor complete information, see:")
-    print("  - README.md for overview")
-    print("  - SETUP.md for installation")
-    print("  - ARCHITECTURE.md for system design")
-    print("  - EXAMPLES.md for API usage")
-    print("  - QUICKREF.md for quick reference")
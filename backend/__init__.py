@@ -1,5 +1,5 @@
 """Initialize backend package."""
 from backend.config import config
 
-__version__ = "1.0.0"
+__version__ = config.APP_VERSION
 __all__ = ["config"]
@@ -12,6 +12,10 @@ load_dotenv(dotenv_path=env_path, override=True)
 class Config:
     """Application configuration."""
     
+    # Application Metadata
+    APP_VERSION = "1.0.0"
+    APP_STATUS = "Production Ready"
+    
     # GitHub API Configuration
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
     GITHUB_API_BASE_URL = os.getenv("GITHUB_API_BASE_URL", "https://api.github.com")
@@ -22,7 +22,7 @@ except ValueError as e:
 app = FastAPI(
     title="IssuePilot",
     description="AI-powered GitHub issue analysis with context enrichment using Google Gemini",
-    version="1.0.0"
+    version=config.APP_VERSION
 )
 
 # Add CORS middleware
@@ -45,7 +45,7 @@ def health_check():
     return {
         "status": "healthy",
         "service": "IssueSense AI",
-        "version": "1.0.0"
+        "version": config.APP_VERSION
     }
 
 